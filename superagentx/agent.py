@@ -1,20 +1,29 @@
 import asyncio
+import copy
+import hashlib
 import json
 import logging
+import random
+import re
 import uuid
-from json import JSONDecodeError
 from typing import Literal, Any
 
+import cachetools
+from openai import APIConnectionError, RateLimitError
+from pydantic_core import from_json
+
 from superagentx.engine import Engine
 from superagentx.result import GoalResult
 from superagentx.constants import SEQUENCE, PARALLEL
 from superagentx.exceptions import StopSuperAgentX
 from superagentx.llm import LLMClient, ChatCompletionParams
+from superagentx.llm.batch import BatchingLLMClient
 from superagentx.prompt import PromptTemplate
-from superagentx.utils.helper import iter_to_aiter
 
 logger = logging.getLogger(__name__)
 
+_JSON_FENCE_PATTERN = re.compile(r'^```(?:json)?\s*|\s*```$')
+
 _GOAL_PROMPT_TEMPLATE = """Review the given output context and make sure
 
 the following goal is achieved.
@@ -54,14 +63,16 @@ class Agent:
             *,
             goal: str,
             role: str,
-            llm: LLMClient,
+            llm: LLMClient | BatchingLLMClient,
             prompt_template: PromptTemplate,
-            agent_id: str | None = uuid.uuid4().hex,
+            agent_id: str | None = None,
             name: str | None = None,
             description: str | None = None,
             engines: list[Engine | list[Engine]] | None = None,
             output_format: str | None = None,
-            max_retry: int = 5
+            max_retry: int = 5,
+            max_parallel: int = 8,
+            verify_cache: bool = True
     ):
         """
         Initializes a new instance of the Agent class.
@@ -90,17 +101,36 @@ class Agent:
             max_retry: The maximum number of retry attempts for operations that may fail.
                 Default is set to 5. This is particularly useful in scenarios where transient errors may occur,
                 ensuring robust execution.
+            max_parallel: The maximum number of engines started concurrently in a parallel group,
+                bounding the in-flight LLM calls this agent can fan out. Default is set to 8.
+            verify_cache: Whether to memoize goal-verification results by query and output
+                context, so a retry that reproduces identical results skips the verification
+                LLM call. Default is set to True.
         """
         self.role = role
         self.goal = goal
         self.llm = llm
         self.prompt_template = prompt_template
-        self.agent_id = agent_id
+        self.agent_id = agent_id or uuid.uuid4().hex
         self.name = name or f'{self.__str__()}-{self.agent_id}'
         self.description = description
         self.engines: list[Engine | list[Engine]] = engines or []
         self.output_format = output_format
         self.max_retry = max_retry
+        self._sema = asyncio.Semaphore(max_parallel)
+        self._verify_cache = cachetools.TTLCache(maxsize=1024, ttl=300) if verify_cache else None
+        # Goal and output format never change after construction - bake them
+        # into the verification prompt once, leaving only the per-call fields
+        # to substitute. Braces are escaped so .format still parses safely.
+        self._goal_prompt = _GOAL_PROMPT_TEMPLATE.replace(
+            '{goal}', self.goal.replace('{', '{{').replace('}', '}}')
+        ).replace(
+            '{output_format}', (self.output_format or '').replace('{', '{{').replace('}', '}}')
+        )
+        # Message-list skeleton for goal verification, built on first use -
+        # per call only the user slot is re-rendered and swapped in.
+        self._verify_msg_skeleton: list[dict] | None = None
+        self._verify_user_slot: int = -1
         logger.debug(
             f'Initiating Agent...\n'
             f'Id : {self.agent_id}\n'
@@ -155,27 +185,67 @@ class Agent:
             self.engines.append(list(engines))
             logger.debug(f'Engines added as {PARALLEL} : {",".join([str(_engine) for _engine in engines])}')
 
+    async def _verify_messages(
+            self,
+            query_instruction: str,
+            output_context: Any
+    ) -> list[dict]:
+        if self._verify_msg_skeleton is None:
+            _sentinel = '__VERIFY_SLOT__'
+            _skeleton = await self.prompt_template.get_messages(
+                input_prompt=_sentinel
+            )
+            self._verify_user_slot = next(
+                _idx
+                for _idx, _msg in enumerate(_skeleton)
+                if _msg.get('content') == _sentinel
+            )
+            self._verify_msg_skeleton = _skeleton
+        messages = copy.copy(self._verify_msg_skeleton)
+        messages[self._verify_user_slot] = {
+            "role": "user",
+            "content": self._goal_prompt.format(
+                query_instruction=query_instruction,
+                output_context=output_context,
+                feedback=""
+            )
+        }
+        return messages
+
     async def _verify_goal(
             self,
             *,
             query_instruction: str,
             results: list[Any],
-            old_memory: str | None = None
+            old_memory: str | None = None,
+            temperature: float | None = None
     ) -> GoalResult:
+        _cache_key = None
+        if self._verify_cache is not None:
+            _cache_key = hashlib.blake2b(
+                json.dumps(
+                    [query_instruction, results, old_memory, temperature],
+                    sort_keys=True,
+                    default=str
+                ).encode(),
+                digest_size=16
+            ).hexdigest()
+            _cached = self._verify_cache.get(_cache_key)
+            if _cached is not None:
+                logger.debug(f'Goal verification cache hit : {_cache_key}')
+                return _cached
+
         if old_memory:
             results = f"output_context:\n{old_memory}\n\n{results}"
             logger.debug(f'Updated Output Context with old memory : {results}')
 
-        prompt_message = await self.prompt_template.get_messages(
-            input_prompt=_GOAL_PROMPT_TEMPLATE,
-            goal=self.goal,
+        prompt_message = await self._verify_messages(
             query_instruction=query_instruction,
-            output_context=results,
-            feedback="",
-            output_format=self.output_format or ""
+            output_context=results
         )
         chat_completion_params = ChatCompletionParams(
-            messages=prompt_message
+            messages=prompt_message,
+            temperature=temperature
         )
         logger.debug(f'Chat Completion Params : {chat_completion_params.model_dump(exclude_none=True)}')
         messages = await self.llm.achat_completion(
@@ -186,15 +256,22 @@ class Agent:
             for choice in messages.choices:
                 if choice and choice.message:
                     _res = choice.message.content or ''
-                    _res = _res.replace('```json', '').replace('```', '')
+                    _res = _JSON_FENCE_PATTERN.sub('', _res.strip())
                     try:
-                        __res = json.loads(_res)
-                        return GoalResult(
+                        # Single C-backed pass over the payload instead of
+                        # stdlib json.loads plus a separate strip step. The
+                        # key cache interns the recurring field names (reason,
+                        # result, is_goal_satisfied) across retries.
+                        __res = from_json(_res, cache_strings='keys')
+                        _goal_result = GoalResult(
                             name=self.name,
                             agent_id=self.agent_id,
                             **__res
                         )
-                    except JSONDecodeError as ex:
+                        if _cache_key is not None:
+                            self._verify_cache[_cache_key] = _goal_result
+                        return _goal_result
+                    except ValueError as ex:
                         _msg = f'Cannot verify goal!\n{ex}'
                         logger.warning(_msg)
                         return GoalResult(
@@ -211,53 +288,171 @@ class Agent:
                 is_goal_satisfied=False
             )
 
+    async def verify_batch(
+            self,
+            *,
+            items: list[tuple[str, list[Any]]]
+    ) -> list[GoalResult]:
+        """
+        Verifies a batch of (query_instruction, results) pairs against this agent's goal in a
+        single LLM call. All items share the goal/output-format preamble, so at batch size K the
+        verification stage costs one round-trip instead of K.
+
+        Args:
+            items: Pairs of query instruction and the output context produced for it.
+
+        Returns:
+            list[GoalResult]
+                One result per item, in input order. If the reply cannot be parsed into one
+                verdict per item, each item gets a GoalResult carrying the error.
+        """
+        _blocks = '\n'.join(
+            f'[{_idx}]\n'
+            f'Query_Instruction: {_query}\n'
+            f'Output_Context : {_results}\n'
+            for _idx, (_query, _results) in enumerate(items, 1)
+        )
+        content = self._goal_prompt.format(
+            query_instruction='Review each numbered item below independently.',
+            output_context=_blocks,
+            feedback=""
+        ) + (
+            '\nGenerate a JSON array with exactly one result object per numbered item, '
+            'in the same order. Always generate the JSON output. Don\'t include any command lines.'
+        )
+        if self._verify_msg_skeleton is None:
+            await self._verify_messages(
+                query_instruction='',
+                output_context=''
+            )
+        prompt_message = copy.copy(self._verify_msg_skeleton)
+        prompt_message[self._verify_user_slot] = {
+            "role": "user",
+            "content": content
+        }
+        chat_completion_params = ChatCompletionParams(
+            messages=prompt_message
+        )
+        messages = await self.llm.achat_completion(
+            chat_completion_params=chat_completion_params
+        )
+        _res = ''
+        if messages and messages.choices:
+            _res = messages.choices[0].message.content or ''
+        _res = _JSON_FENCE_PATTERN.sub('', _res.strip())
+        try:
+            _verdicts = from_json(_res, cache_strings='keys')
+            if not isinstance(_verdicts, list) or len(_verdicts) != len(items):
+                raise ValueError(f'Expected {len(items)} verdicts, got {_verdicts!r}')
+            return [
+                GoalResult(
+                    name=self.name,
+                    agent_id=self.agent_id,
+                    **_verdict
+                )
+                for _verdict in _verdicts
+            ]
+        except ValueError as ex:
+            _msg = f'Cannot verify goal batch!\n{ex}'
+            logger.warning(_msg)
+            return [
+                GoalResult(
+                    name=self.name,
+                    agent_id=self.agent_id,
+                    content=_res,
+                    error=_msg
+                )
+                for _ in items
+            ]
+
     async def _execute(
             self,
             query_instruction: str,
             pre_result: str | None = None,
-            old_memory: str | None = None
+            old_memory: str | None = None,
+            temperature: float | None = None
     ) -> GoalResult:
         results = []
-        instruction = query_instruction
         if old_memory:
-            instruction = f"Context:\n{old_memory}\nQuestion: {query_instruction}"
-            logger.debug(f'Updated Query Instruction with old memory : {instruction}')
-        async for _engines in iter_to_aiter(self.engines):
+            # Old memory rides along as a separate system message inside the
+            # engines, keeping the user instruction itself cache-stable.
+            logger.debug(f'Executing with old memory : {old_memory}')
+        async def _bounded_start(_engine: Engine):
+            async with self._sema:
+                return await _engine.start(
+                    input_prompt=query_instruction,
+                    pre_result=pre_result,
+                    old_memory=old_memory
+                )
+
+        for _engines in self.engines:
             if isinstance(_engines, list):
                 logger.debug(f'Engine(s) are executing : {",".join([str(_engine) for _engine in _engines])}')
                 _res = await asyncio.gather(
                     *[
-                        _engine.start(
-                            input_prompt=instruction,
-                            pre_result=pre_result
-                        )
-                        async for _engine in iter_to_aiter(_engines)
+                        _bounded_start(_engine)
+                        for _engine in _engines
                     ]
                 )
                 logger.debug(f'Engine(s) results : {_res}')
             else:
                 logger.debug(f'Engine is executing : {_engines}')
-                _res = await _engines.start(
-                    input_prompt=instruction,
-                    pre_result=pre_result
-                )
+                _res = await _bounded_start(_engines)
                 logger.debug(f'Engine result : {_res}')
             results.append(_res)
         final_result = await self._verify_goal(
             results=results,
             query_instruction=query_instruction,
-            old_memory=old_memory
+            old_memory=old_memory,
+            temperature=temperature
         )
         logger.debug(f"Final Goal Result :\n{final_result.model_dump()}")
         return final_result
 
+    async def _execute_speculative(
+            self,
+            *,
+            query_instruction: str,
+            pre_result: str | None = None,
+            old_memory: str | None = None,
+            speculative_retries: int
+    ) -> GoalResult | None:
+        logger.info(f"Agent `{self.name}` launching {speculative_retries} speculative attempts")
+        pending = {
+            asyncio.create_task(
+                self._execute(
+                    query_instruction=query_instruction,
+                    pre_result=pre_result,
+                    old_memory=old_memory
+                )
+            )
+            for _ in range(speculative_retries)
+        }
+        _goal_result = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                for _task in done:
+                    _goal_result = _task.result()
+                    if _goal_result.is_goal_satisfied:
+                        return _goal_result
+        finally:
+            for _task in pending:
+                _task.cancel()
+        logger.warning(f"Done engine `{self.name}` speculative retries {speculative_retries}!")
+        return _goal_result
+
     async def execute(
             self,
             *,
             query_instruction: str,
             pre_result: str | None = None,
             old_memory: str | None = None,
-            stop_if_goal_not_satisfied: bool = False
+            stop_if_goal_not_satisfied: bool = False,
+            speculative_retries: int = 1
     ) -> GoalResult | None:
         """
         Executes the specified query instruction to achieve a defined goal.
@@ -277,6 +472,10 @@ class Agent:
                 When set to True, the engine operation will halt if the defined goal is not met,
                 preventing any further actions. Defaults to False, allowing the process to continue regardless
                 of goal satisfaction.
+            speculative_retries: The number of attempts to launch concurrently, returning the first
+                one whose goal is satisfied and cancelling the rest. Trades extra tokens for latency -
+                suitable for workloads tolerant of duplicate cost. Only applies when
+                `stop_if_goal_not_satisfied` is False; defaults to 1, keeping the serial retry loop.
 
         Returns:
             GoalResult | None
@@ -284,14 +483,34 @@ class Agent:
                 details about the success or failure of the operation, along with relevant data. If the
                 execution cannot be completed or if an error occurs, the method may return `None`.
         """
-        _goal_result = None
-        for _retry in range(1, self.max_retry+1):
-            logger.info(f"Agent `{self.name}` retry {_retry}")
-            _goal_result = await self._execute(
+        if speculative_retries > 1 and not stop_if_goal_not_satisfied:
+            return await self._execute_speculative(
                 query_instruction=query_instruction,
                 pre_result=pre_result,
-                old_memory=old_memory
+                old_memory=old_memory,
+                speculative_retries=speculative_retries
             )
+
+        _goal_result = None
+        _temperature = None
+        for _retry in range(1, self.max_retry+1):
+            logger.info(f"Agent `{self.name}` retry {_retry}")
+            try:
+                _goal_result = await self._execute(
+                    query_instruction=query_instruction,
+                    pre_result=pre_result,
+                    old_memory=old_memory,
+                    temperature=_temperature
+                )
+            except (RateLimitError, APIConnectionError) as ex:
+                # Transient provider trouble - back off exponentially with
+                # jitter instead of hammering straight back.
+                if _retry == self.max_retry:
+                    raise
+                _delay = min(8.0, 0.5 * (2 ** (_retry - 1))) + random.uniform(0, 0.5)
+                logger.warning(f'Provider error, retrying in {_delay:.1f}s... {ex}')
+                await asyncio.sleep(_delay)
+                continue
             if _goal_result.is_goal_satisfied:
                 return _goal_result
             elif _goal_result.is_goal_satisfied is False and stop_if_goal_not_satisfied:
@@ -299,6 +518,10 @@ class Agent:
                     message='Superagentx stopped forcefully since `stop` flag has been set!',
                     goal_result=_goal_result
                 )
+            # Parse failures and unsatisfied goals retry immediately, with the
+            # verification temperature bumped so the next attempt actually
+            # differs instead of replaying the same verdict.
+            _temperature = min(1.0, (_temperature or 0.0) + 0.1)
 
         logger.warning(f"Done engine `{self.name}` max retry {self.max_retry}!")
         return _goal_result
@@ -1,34 +1,124 @@
 import asyncio
+import functools
 import logging
+import os
 import uuid
 from typing import Literal
 
-import yaml
-
 from superagentx.agent import Agent
 from superagentx.config import is_verbose_enabled
 from superagentx.constants import SEQUENCE, PARALLEL
 from superagentx.exceptions import StopSuperAgentX
 from superagentx.memory import Memory
 from superagentx.result import GoalResult
-from superagentx.utils.helper import iter_to_aiter
 
 is_verbose_enabled()
 
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _get_dumper():
+    # PyYAML's import is deferred to the first serialized result, so processes
+    # that import the pipe without running a flow skip the cost entirely. One
+    # dumper configuration for every serialized result - C emitter when
+    # libyaml is present, insertion order kept.
+    import yaml
+    try:
+        from yaml import CSafeDumper as _YamlDumper
+    except ImportError:
+        from yaml import SafeDumper as _YamlDumper
+    return functools.partial(
+        yaml.dump,
+        Dumper=_YamlDumper,
+        default_flow_style=False,
+        sort_keys=False
+    )
+
+
+class _PlanCache:
+    """
+    A small in-process cache of goal results keyed by query embedding. Recurring
+    goals with near-identical queries reuse the previous flow's results instead
+    of re-running the whole agent pipeline.
+    """
+
+    def __init__(
+            self,
+            maxsize: int = 256
+    ):
+        self.maxsize = maxsize
+        self._entries: list[tuple[list[float], str, list[GoalResult]]] = []
+
+    @staticmethod
+    def _cosine(
+            a: list[float],
+            b: list[float]
+    ) -> float:
+        dot = sum(_x * _y for _x, _y in zip(a, b))
+        norm_a = sum(_x * _x for _x in a) ** 0.5
+        norm_b = sum(_y * _y for _y in b) ** 0.5
+        if not norm_a or not norm_b:
+            return 0.0
+        return dot / (norm_a * norm_b)
+
+    def lookup(
+            self,
+            embedding: list[float],
+            threshold: float
+    ) -> list[GoalResult] | None:
+        best_score = 0.0
+        best_results = None
+        for _embedding, _query, _results in self._entries:
+            score = self._cosine(embedding, _embedding)
+            if score >= threshold and score > best_score:
+                best_score = score
+                best_results = _results
+        if best_results is not None:
+            logger.debug(f'Plan cache hit with similarity {best_score}')
+        return best_results
+
+    def put(
+            self,
+            embedding: list[float],
+            query: str,
+            results: list[GoalResult]
+    ) -> None:
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(0)
+        self._entries.append((embedding, query, results))
+
+
 class AgentXPipe:
 
+    __slots__ = (
+        'pipe_id',
+        'name',
+        'description',
+        'agents',
+        'memory',
+        'memory_id',
+        'chat_id',
+        'stop_if_goal_not_satisfied',
+        '_sema',
+        '_plan_cache',
+        '_plan_cache_threshold',
+        '_parallel_pipeline'
+    )
+
     def __init__(
             self,
             *,
-            pipe_id: str = uuid.uuid4().hex,
+            pipe_id: str | None = None,
             name: str | None = None,
             description: str | None = None,
             agents: list[Agent | list[Agent]] | None = None,
             memory: Memory | None = None,
-            stop_if_goal_not_satisfied: bool = False
+            stop_if_goal_not_satisfied: bool = False,
+            max_parallel: int = 8,
+            plan_cache: bool = False,
+            plan_cache_similarity_threshold: float = 0.9,
+            parallel_pipeline: bool = False
     ):
         """
         Initializes a new instance of the class with specified parameters.
@@ -56,16 +146,33 @@ class AgentXPipe:
                 When set to True, the agentxpipe operation will halt if the defined goal is not met,
                 preventing any further actions. Defaults to False, allowing the process to continue regardless
                 of goal satisfaction.
+            max_parallel: The maximum number of agents executed concurrently in a parallel group,
+                bounding the in-flight LLM calls the pipe can fan out. Default is set to 8.
+                Setting it to the size of the largest agent group restores unbounded fan-out.
+            plan_cache: Whether to cache successful flow results keyed by query embedding and
+                reuse them for near-identical queries, skipping the full pipeline. Defaults to False.
+            plan_cache_similarity_threshold: The minimum cosine similarity between query
+                embeddings for a cached plan to be reused. Defaults to 0.9.
+            parallel_pipeline: Whether to overlap the pipe's steps instead of running them as a
+                strict sequential barrier. Only safe when later steps do not depend on earlier
+                results - pre-results are not threaded between steps in this mode. Defaults to False.
         """
-        self.pipe_id = pipe_id
-        self.name = name or f'{self.__str__()}-{self.pipe_id}'
+        self.pipe_id = pipe_id or uuid.uuid4().hex
+        # type(self).__name__ keeps subclasses honest without a method call.
+        self.name = name or f'{type(self).__name__}-{self.pipe_id}'
         self.description = description
         self.agents: list[Agent | list[Agent]] = agents or []
         self.memory = memory
+        self.memory_id = None
+        self.chat_id = None
         if self.memory:
             self.memory_id = uuid.uuid4().hex
             self.chat_id = uuid.uuid4().hex
         self.stop_if_goal_not_satisfied = stop_if_goal_not_satisfied
+        self._sema = asyncio.Semaphore(max_parallel)
+        self._plan_cache = _PlanCache() if plan_cache else None
+        self._plan_cache_threshold = plan_cache_similarity_threshold
+        self._parallel_pipeline = parallel_pipeline
 
         logger.debug(
             f'Initiating AgentXPipe...\n'
@@ -83,13 +190,16 @@ class AgentXPipe:
     def __repr__(self):
         return f"<{self.__str__()}>"
 
-    async def add(
+    def add(
             self,
             *agents: Agent,
             execute_type: Literal['SEQUENCE', 'PARALLEL'] = 'SEQUENCE'
     ) -> None:
         """
         Adds one or more Agent instances to the current context for processing.
+        This is a plain synchronous method (it only appends to an in-memory
+        list); earlier releases declared it async and callers still awaiting
+        it must drop the await.
 
         This method allows the user to include multiple agents that will be used
         for execution based on the specified execution type. The `execute_type`
@@ -119,17 +229,31 @@ class AgentXPipe:
             logger.debug(f'Agents added as {PARALLEL} : {",".join([str(_agent) for _agent in agents])}')
 
     @staticmethod
-    async def _pre_result(
-            results: list[GoalResult] | None = None
+    def _pre_result(
+            results: list[GoalResult | list[GoalResult]],
+            cache: list[str]
     ) -> list[str]:
         if not results:
             return []
-        return [
-            (f'Reason: {result.reason}\n'
-             f'Result: \n{yaml.dump(result.result)}\n'
-             f'Is Goal Satisfied: {result.is_goal_satisfied}\n\n')
-            async for result in iter_to_aiter(results)
+        # Parallel agent groups land in results as one list entry - flatten
+        # them so every goal result gets its own formatted block. Only the
+        # results appended since the previous call are serialized - earlier
+        # entries are reused from the flow-local cache, so a flow of N agents
+        # dumps each result once instead of re-dumping the whole history. The
+        # cache lives on the flow's stack, keeping concurrent flows on one
+        # pipe isolated from each other.
+        flat_results = [
+            _result
+            for _entry in results
+            for _result in (_entry if isinstance(_entry, list) else [_entry])
         ]
+        for result in flat_results[len(cache):]:
+            cache.append(
+                f'Reason: {result.reason}\n'
+                f'Result: \n{_get_dumper()(result.result)}\n'
+                f'Is Goal Satisfied: {result.is_goal_satisfied}\n\n'
+            )
+        return list(cache)
 
     async def add_memory(
             self,
@@ -152,14 +276,30 @@ class AgentXPipe:
             None
         """
         logger.debug(f'Add prompt instruction to the memory : {prompt_instruction}')
-        async for prompt in iter_to_aiter(prompt_instruction):
-            await self.memory.add(
-                memory_id=self.memory_id,
-                chat_id=self.chat_id,
-                message_id=uuid.uuid4().hex,
-                role=prompt.get("role"),
-                data=prompt.get("content"),
-                reason=prompt.get("reason")
+        if not prompt_instruction:
+            return
+        # One entropy read covers the whole batch.
+        _random = os.urandom(16 * len(prompt_instruction))
+        records = [
+            {
+                "memory_id": self.memory_id,
+                "chat_id": self.chat_id,
+                "message_id": uuid.UUID(bytes=_random[_idx * 16:(_idx + 1) * 16], version=4).hex,
+                "role": prompt.get("role"),
+                "data": prompt.get("content"),
+                "reason": prompt.get("reason")
+            }
+            for _idx, prompt in enumerate(prompt_instruction)
+        ]
+        if hasattr(self.memory, 'add_many'):
+            # One history connection and one vector insert for the whole batch.
+            await self.memory.add_many(records)
+        else:
+            await asyncio.gather(
+                *[
+                    self.memory.add(**record)
+                    for record in records
+                ]
             )
 
     async def retrieve_memory(
@@ -193,36 +333,152 @@ class AgentXPipe:
             limit=10,
         )
 
-    async def _flow(
+    async def _retrieve_context(
+            self,
+            query_instruction: str
+    ) -> str | None:
+        if hasattr(self.memory, 'has_any') and not await self.memory.has_any(
+                memory_id=self.memory_id,
+                chat_id=self.chat_id
+        ):
+            # Nothing stored for this session yet - skip the vector search.
+            logger.debug('No memory recorded yet, skipping retrieval')
+            return None
+        old_memory = await self.retrieve_memory(query_instruction)
+        if old_memory:
+            # Just the remembered content, joined in one pass - agents
+            # carry it as a separate system message alongside the
+            # instruction.
+            return " ".join(
+                _mem["content"]
+                for _mem in old_memory
+                if _mem.get("content")
+            ) + " "
+        return None
+
+    def _write_behind(
+            self,
+            result: GoalResult,
+            pending_writes: list[asyncio.Task]
+    ) -> None:
+        if result.result and result.reason:
+            assistant = {
+                "role": "assistant",
+                "content": _get_dumper()(result.result),
+                "reason": result.reason
+            }
+            # Write behind - the next step's work need not wait on the
+            # memory insert.
+            pending_writes.append(
+                asyncio.create_task(
+                    self.add_memory([assistant])
+                )
+            )
+
+    @staticmethod
+    async def _settle_writes(
+            pending_writes: list[asyncio.Task]
+    ) -> None:
+        if not pending_writes:
+            return
+        _outcomes = await asyncio.gather(*pending_writes, return_exceptions=True)
+        for _outcome in _outcomes:
+            if isinstance(_outcome, Exception):
+                logger.error('Memory write failed!', exc_info=_outcome)
+
+    async def _flow_pipelined(
+            self,
+            query_instruction: str
+    ) -> list:
+        # Steps are declared independent (parallel_pipeline=True), so there is
+        # no pre-result threading; every step runs concurrently with memory
+        # writes overlapping the still-running steps.
+        old_memory = None
+        if self.memory:
+            old_memory = await self._retrieve_context(query_instruction)
+        pending_writes: list[asyncio.Task] = []
+
+        async def _run_step(_agents):
+            try:
+                if isinstance(_agents, list):
+                    async def _bounded_execute(_agent: Agent):
+                        async with self._sema:
+                            return await _agent.execute(
+                                query_instruction=query_instruction,
+                                old_memory=old_memory,
+                                stop_if_goal_not_satisfied=self.stop_if_goal_not_satisfied
+                            )
+
+                    return await asyncio.gather(
+                        *[
+                            _bounded_execute(_agent)
+                            for _agent in _agents
+                        ]
+                    )
+                _res = await _agents.execute(
+                    query_instruction=query_instruction,
+                    old_memory=old_memory,
+                    stop_if_goal_not_satisfied=self.stop_if_goal_not_satisfied
+                )
+                if self.memory and _res:
+                    self._write_behind(_res, pending_writes)
+                return _res
+            except StopSuperAgentX as ex:
+                logger.warning(ex)
+                return ex.goal_result
+
+        results = await asyncio.gather(
+            *[
+                _run_step(_agents)
+                for _agents in self.agents
+            ]
+        )
+        await self._settle_writes(pending_writes)
+        return results
+
+    async def _flow_stream(
             self,
             query_instruction: str
     ):
+        if self._parallel_pipeline:
+            # Pipelined steps run concurrently and finish near-together; the
+            # collected results are replayed for streaming consumers.
+            for _res in await self._flow_pipelined(
+                    query_instruction=query_instruction
+            ):
+                yield _res
+            return
         trigger_break = False
         results = []
         old_memory = None
-        async for _agents in iter_to_aiter(self.agents):
-            pre_result = await self._pre_result(results=results)
+        pending_writes: list[asyncio.Task] = []
+        _pre_result_cache: list[str] = []
+        if self.memory:
+            # The query never changes within one flow - embed and search once
+            # up front instead of re-running the vector search per agent step.
+            old_memory = await self._retrieve_context(query_instruction)
+            logger.debug(f"Updated with old memory.\n{old_memory}")
+        for _agents in self.agents:
+            # First step has nothing to format - skip the call outright.
+            pre_result = self._pre_result(results=results, cache=_pre_result_cache) if results else []
             logger.debug(f'Updated with previous results.\nPrevious Result : {pre_result}')
-            if self.memory:
-                old_memory = await self.retrieve_memory(query_instruction)
-                if old_memory:
-                    message_content = ""
-                    async for _mem in iter_to_aiter(old_memory):
-                        message_content += f"{_mem.get('content')} "
-                    old_memory = f"Context :\n{message_content}\nQuestion : {query_instruction}"
-                logger.debug(f"Updated with old memory.\n{old_memory}")
             try:
                 if isinstance(_agents, list):
                     logger.debug(f'Agent(s) are executing : {",".join([str(_agent) for _agent in _agents])}')
-                    _res = await asyncio.gather(
-                        *[
-                            _agent.execute(
+
+                    async def _bounded_execute(_agent: Agent):
+                        async with self._sema:
+                            return await _agent.execute(
                                 query_instruction=query_instruction,
                                 pre_result=pre_result,
                                 old_memory=old_memory,
                                 stop_if_goal_not_satisfied=self.stop_if_goal_not_satisfied
                             )
-                            async for _agent in iter_to_aiter(_agents)
+
+                    _res = await asyncio.gather(
+                        *[
+                            _bounded_execute(_agent)
+                            for _agent in _agents
                         ]
                     )
                     logger.debug(f'Agent(s) results : {_res}')
@@ -235,23 +491,79 @@ class AgentXPipe:
                         stop_if_goal_not_satisfied=self.stop_if_goal_not_satisfied
                     )
                     logger.debug(f'Agent result : {_res}')
-                if self.memory:
-                    if _res.result and _res.reason:
-                        assistant = {
-                            "role": "assistant",
-                            "content": f"{yaml.dump(_res.result)}",
-                            "reason": _res.reason
-                        }
-                        await self.add_memory([assistant])
+                if self.memory and isinstance(_res, GoalResult):
+                    self._write_behind(_res, pending_writes)
             except StopSuperAgentX as ex:
                 trigger_break = True
                 logger.warning(ex)
                 _res = ex.goal_result
 
             results.append(_res)
+            yield _res
             if trigger_break:
                 break
-        return results
+        await self._settle_writes(pending_writes)
+
+    async def _flow(
+            self,
+            query_instruction: str
+    ):
+        return [
+            _res
+            async for _res in self._flow_stream(
+                query_instruction=query_instruction
+            )
+        ]
+
+    async def flow_stream(
+            self,
+            query_instruction: str
+    ):
+        """
+        Processes the specified query instruction and yields each GoalResult the moment its
+        step completes, instead of waiting for the whole flow - interactive consumers get
+        time-to-first-result of one step rather than the sum of all steps. Successful runs
+        feed the plan cache just like `flow`, and cached plans are replayed result by result.
+
+        Args:
+            query_instruction: A string representing the instruction or query that defines the goal to be achieved.
+                This should be a clear and actionable statement that the method can execute.
+        """
+        logger.info(f"Pipe {self.name} streaming...")
+        _query_embedding = None
+        if self._plan_cache is not None:
+            _embedder = self._embedder()
+            if _embedder:
+                _query_embedding = await _embedder.aembed(text=query_instruction)
+                _cached = self._plan_cache.lookup(
+                    embedding=_query_embedding,
+                    threshold=self._plan_cache_threshold
+                )
+                if _cached is not None:
+                    logger.info(f"Pipe {self.name} serving results from plan cache")
+                    for _res in _cached:
+                        yield _res
+                    return
+        results = []
+        async for _res in self._flow_stream(
+                query_instruction=query_instruction
+        ):
+            results.append(_res)
+            yield _res
+        if (
+                _query_embedding is not None
+                and results
+                and all(
+                    _r and _r.is_goal_satisfied
+                    for _res in results
+                    for _r in (_res if isinstance(_res, list) else [_res])
+                )
+        ):
+            self._plan_cache.put(
+                embedding=_query_embedding,
+                query=query_instruction,
+                results=results
+            )
 
     async def flow(
             self,
@@ -277,6 +589,43 @@ class AgentXPipe:
                 corresponding operation and may include additional context or data.
         """
         logger.info(f"Pipe {self.name} starting...")
-        return await self._flow(
+        _query_embedding = None
+        if self._plan_cache is not None:
+            _embedder = self._embedder()
+            if _embedder:
+                _query_embedding = await _embedder.aembed(text=query_instruction)
+                _cached = self._plan_cache.lookup(
+                    embedding=_query_embedding,
+                    threshold=self._plan_cache_threshold
+                )
+                if _cached is not None:
+                    logger.info(f"Pipe {self.name} serving results from plan cache")
+                    return _cached
+        results = await self._flow(
             query_instruction=query_instruction
         )
+        if (
+                _query_embedding is not None
+                and results
+                and all(
+                    _r and _r.is_goal_satisfied
+                    for _res in results
+                    for _r in (_res if isinstance(_res, list) else [_res])
+                )
+        ):
+            self._plan_cache.put(
+                embedding=_query_embedding,
+                query=query_instruction,
+                results=results
+            )
+        return results
+
+    def _embedder(self):
+        for _agents in self.agents:
+            _agent = _agents[0] if isinstance(_agents, list) else _agents
+            _llm = _agent.llm
+            if hasattr(_llm, 'aembed'):
+                return _llm
+            # A shared BatchingLLMClient wraps the real client.
+            return getattr(_llm, 'llm', None)
+        return None
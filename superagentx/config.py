@@ -2,13 +2,19 @@ import logging
 import os
 import sys
 
+_TRUTHY = frozenset({'1', 'true', 'yes', 'on'})
+
+# Computed once at import - callers that just need a cheap boolean can read
+# this directly instead of re-querying the environment.
+_VERBOSE = (os.environ.get('DEBUGGING') or os.environ.get('VERBOSE') or '').lower() in _TRUTHY
+
 
 def is_verbose_enabled():
-    verbose = os.environ.get('DEBUGGING') or os.environ.get('VERBOSE')
-    if verbose and verbose.lower() in ('1', 'true'):
+    if _VERBOSE and not getattr(is_verbose_enabled, '_done', False):
         logging.basicConfig(
             format='%(name)s - %(levelname)s - %(message)s',
             stream=sys.stdout,
             level=logging.DEBUG,
             force=True
         )
+        is_verbose_enabled._done = True
@@ -1,4 +1,6 @@
+import asyncio
 import inspect
+import json
 import logging
 import typing
 
@@ -6,6 +8,7 @@ from superagentx.exceptions import ToolError
 from superagentx.handler.base import BaseHandler
 from superagentx.handler.exceptions import InvalidHandler
 from superagentx.llm import LLMClient, ChatCompletionParams
+from superagentx.llm.batch import BatchingLLMClient
 from superagentx.prompt import PromptTemplate
 from superagentx.utils.helper import iter_to_aiter, sync_to_async
 from superagentx.utils.parsers.base import BaseParser
@@ -19,7 +22,7 @@ class Engine:
             self,
             *,
             handler: BaseHandler,
-            llm: LLMClient,
+            llm: LLMClient | BatchingLLMClient,
             prompt_template: PromptTemplate,
             tools: list[dict] | list[str] | None = None,
             output_parser: BaseParser | None = None
@@ -42,6 +45,14 @@ class Engine:
         self.prompt_template = prompt_template
         self.tools = tools
         self.output_parser = output_parser
+        # Tool schemas and method lookups are pure functions of the handler,
+        # which never changes after construction - build them once.
+        self._tools_cache: list[dict] | None = None
+        self._dispatch: dict[str, tuple[typing.Callable, bool, bool]] = {}
+        # Single-flight map - concurrent invocations of the same tool with the
+        # same arguments share one execution instead of each hitting the
+        # network/DB behind the tool.
+        self._inflight: dict[str, asyncio.Future] = {}
 
     def __str__(self):
         return f'Engine {self.handler.__class__}'
@@ -61,6 +72,9 @@ class Engine:
         return _funcs_props
 
     async def _construct_tools(self) -> list[dict]:
+        if self._tools_cache is not None:
+            return self._tools_cache
+
         funcs = self.handler.tools or dir(self.handler)
         logger.debug(f"Handler Funcs : {funcs}")
         if not funcs:
@@ -71,28 +85,89 @@ class Engine:
             _tools = await self.__funcs_props(funcs=self.tools)
         if not _tools:
             _tools = await self.__funcs_props(funcs=funcs)
+        self._tools_cache = _tools
         return _tools
 
-    async def start(
+    async def _invoke_tool(
+            self,
+            tool
+    ) -> typing.Any:
+        logger.debug(f'Checking tool function : {self.handler.__class__}.{tool.name}')
+        _cached = self._dispatch.get(tool.name)
+        if _cached is None:
+            func = getattr(self.handler, tool.name, None)
+            if func and (inspect.ismethod(func) or inspect.isfunction(func)):
+                _cached = (
+                    func,
+                    inspect.iscoroutinefunction(func),
+                    getattr(func, '_blocking', True)
+                )
+                self._dispatch[tool.name] = _cached
+        if not _cached:
+            logger.warning(f'Not valid handler final func {tool.name}!')
+            return None
+
+        func, _is_coro, _is_blocking = _cached
+        _kwargs = tool.arguments or {}
+        logger.debug(
+            f'Executing tool function : {self.handler.__class__}.{tool.name}, '
+            f'With arguments : {_kwargs}'
+        )
+        _key = f'{tool.name}:{json.dumps(_kwargs, sort_keys=True, default=str)}'
+        _flight = self._inflight.get(_key)
+        if _flight is not None:
+            logger.debug(f'Awaiting in-flight tool call : {_key}')
+            res = await _flight
+        else:
+            _future = asyncio.get_running_loop().create_future()
+            self._inflight[_key] = _future
+            try:
+                if _is_coro:
+                    res = await func(**_kwargs)
+                elif _is_blocking:
+                    res = await sync_to_async(func, **_kwargs)
+                else:
+                    # Tagged @non_blocking - run inline, the executor hop
+                    # would cost more than the call.
+                    res = func(**_kwargs)
+                _future.set_result(res)
+            except Exception as ex:
+                _future.set_exception(ex)
+                # Mark the exception retrieved - without a duplicate waiter the
+                # future would otherwise log "exception was never retrieved"
+                # at GC time.
+                _future.exception()
+                raise
+            finally:
+                self._inflight.pop(_key, None)
+
+        logger.debug(f'Tool function result : {res}')
+
+        if res and self.output_parser:
+            return await self.output_parser.parse(res)
+        return res
+
+    async def starts(
             self,
             input_prompt: str,
             pre_result: str | None = None,
+            old_memory: str | None = None,
             **kwargs
-    ) -> list[typing.Any]:
+    ):
         """
-        Initiates a process using the given input prompt and optional pre-processing result.
+        Initiates a process using the given input prompt and yields results as they become
+        available. Tool calls run concurrently and each result is yielded the moment its call
+        completes, so downstream consumers can start reducing before the slowest tool finishes.
 
         Args:
             input_prompt: The input string to initiate the process. This could be a query, command, or instruction
                  based on the context.
             pre_result: An optional pre-computed result or state to be used during the execution.
                 Defaults to `None` if not provided.
+            old_memory: An optional previous context of the user's instruction. Carried as its own
+                system message so the varying user instruction stays a stable prefix for
+                provider-side prompt caching.
             kwargs: Additional keyword arguments to update the `input_prompt` dynamically.
-
-        Returns:
-            list[typing.Any]
-                A list of results generated during the process. The content and
-                structure of the list depend on the implementation details.
         """
         if pre_result:
             input_prompt = f'{input_prompt}\n\n{pre_result}'
@@ -103,6 +178,13 @@ class Engine:
             input_prompt=input_prompt,
             **kwargs
         )
+        if old_memory:
+            prompt_messages.append(
+                {
+                    "role": "system",
+                    "content": f"Context:\n{old_memory}"
+                }
+            )
         logger.debug(f"Prompt Message : {prompt_messages}")
         tools = await self._construct_tools()
         logger.debug(f"Handler Tools : {tools}")
@@ -118,33 +200,66 @@ class Engine:
         if not messages:
             raise ToolError("Tool not found for the inputs!")
 
-        results = []
-        async for message in iter_to_aiter(messages):
+        _tool_calls = []
+        for message in messages:
             if message.tool_calls:
-                async for tool in iter_to_aiter(message.tool_calls):
-                    if tool.tool_type == 'function':
-                        logger.debug(f'Checking tool function : {self.handler.__class__}.{tool.name}')
-                        func = getattr(self.handler, tool.name)
-                        if func and (inspect.ismethod(func) or inspect.isfunction(func)):
-                            _kwargs = tool.arguments or {}
-                            logger.debug(
-                                f'Executing tool function : {self.handler.__class__}.{tool.name}, '
-                                f'With arguments : {_kwargs}'
-                            )
-                            if inspect.iscoroutinefunction(func):
-                                res = await func(**_kwargs)
-                            else:
-                                res = await sync_to_async(func, **_kwargs)
-
-                            logger.debug(f'Tool function result : {res}')
-
-                            if res:
-                                if not self.output_parser:
-                                    results.append(res)
-                                else:
-                                    results.append(await self.output_parser.parse(res))
-                        else:
-                            logger.warning(f'Not valid handler final func {func}!')
+                _tool_calls += [
+                    tool
+                    for tool in message.tool_calls
+                    if tool.tool_type == 'function'
+                ]
             else:
-                results.append(message.content)
-        return results
+                yield message.content
+        _tasks = [
+            asyncio.ensure_future(self._invoke_tool(tool))
+            for tool in _tool_calls
+        ]
+        try:
+            for _completed in asyncio.as_completed(_tasks):
+                res = await _completed
+                if res:
+                    yield res
+        finally:
+            # A failing tool (or an early consumer exit) must not leave
+            # sibling calls running detached with unobserved exceptions.
+            for _task in _tasks:
+                if _task.done():
+                    if not _task.cancelled():
+                        _task.exception()
+                else:
+                    _task.cancel()
+
+    async def start(
+            self,
+            input_prompt: str,
+            pre_result: str | None = None,
+            old_memory: str | None = None,
+            **kwargs
+    ) -> list[typing.Any]:
+        """
+        Initiates a process using the given input prompt and optional pre-processing result.
+
+        Args:
+            input_prompt: The input string to initiate the process. This could be a query, command, or instruction
+                 based on the context.
+            pre_result: An optional pre-computed result or state to be used during the execution.
+                Defaults to `None` if not provided.
+            old_memory: An optional previous context of the user's instruction. Carried as its own
+                system message so the varying user instruction stays a stable prefix for
+                provider-side prompt caching.
+            kwargs: Additional keyword arguments to update the `input_prompt` dynamically.
+
+        Returns:
+            list[typing.Any]
+                A list of results generated during the process. The content and
+                structure of the list depend on the implementation details.
+        """
+        return [
+            res
+            async for res in self.starts(
+                input_prompt=input_prompt,
+                pre_result=pre_result,
+                old_memory=old_memory,
+                **kwargs
+            )
+        ]
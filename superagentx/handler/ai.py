@@ -1,7 +1,8 @@
 from superagentx.handler.base import BaseHandler
 from superagentx.handler.decorators import tool
 from superagentx.llm import LLMClient
-from superagentx.llm.models import ChatCompletionParams
+from superagentx.llm.batch import BatchingLLMClient
+from superagentx.llm.models import ChatCompletionParams, Message
 
 
 class AIHandler(BaseHandler):
@@ -15,16 +16,45 @@ class AIHandler(BaseHandler):
             self,
             llm: LLMClient,
             role: str | None = None,
-            story_content: str | None = None
+            story_content: str | None = None,
+            batcher: BatchingLLMClient | None = None
     ):
         super().__init__()
         self.llm = llm
         self.role = role
         self.story_content = story_content
+        self.batcher = batcher
 
         if not self.role:
             self.role = "You are a helpful assistant."
 
+        # Static pieces built once - per call only the user message changes,
+        # and the params template is copied without re-validation.
+        self._sys_msg = Message.model_construct(
+            role='system',
+            content=self.role
+        )
+        self._params_template = ChatCompletionParams.model_construct(messages=[])
+
+    def _build_params(
+            self,
+            instruction: str
+    ) -> ChatCompletionParams:
+        content = instruction
+        if self.story_content:
+            content = f"\nBack Story: {self.story_content} Instruction: {instruction}"
+        return self._params_template.model_copy(
+            update={
+                'messages': [
+                    self._sys_msg,
+                    Message.model_construct(
+                        role='user',
+                        content=content
+                    )
+                ]
+            }
+        )
+
     @tool
     async def text_creation(
             self,
@@ -40,26 +70,35 @@ class AIHandler(BaseHandler):
             @param instruction: A string containing the user instruction or prompt that guides the text generation process.
 
         """
-        content = instruction
-        if self.story_content:
-            content = f"\nBack Story: {self.story_content} Instruction: {instruction}"
-        messages = [
-            {
-                "role": "system",
-                "content": self.role
-            },
-            {
-                "role": "user",
-                "content": content
-            }
-        ]
-        chat_completion = ChatCompletionParams(
-            messages=messages
-        )
+        chat_completion = self._build_params(instruction)
+        if self.batcher:
+            return await self.batcher.achat_completion(
+                chat_completion_params=chat_completion
+            )
         return await self.llm.achat_completion(
             chat_completion_params=chat_completion
         )
 
+    async def stream_text_creation(
+            self,
+            *,
+            instruction: str
+    ):
+        """
+        Streams generated text chunk by chunk as the model produces it, so downstream work
+        (file writes, UI updates, uploads) starts at first-token latency instead of waiting
+        for the full response.
+
+        Args:
+            @param instruction: A string containing the user instruction or prompt that guides the text generation process.
+
+        """
+        chat_completion = self._build_params(instruction)
+        async for chunk in self.llm.astream_chat_completion(
+            chat_completion_params=chat_completion
+        ):
+            yield chunk
+
     async def video_creation(
             self
     ):
@@ -0,0 +1,533 @@
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import logging
+import os
+import threading
+import time
+from typing import Literal
+
+import boto3
+import botocore.config
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from superagentx.handler.base import BaseHandler
+from superagentx.handler.decorators import tool
+from superagentx.utils.helper import iter_to_aiter, sync_to_async
+
+logger = logging.getLogger(__name__)
+
+_MB = 1024 * 1024
+
+# Sessions are cached per credential/region pair so every handler instance
+# shares the same credential resolution and the underlying botocore HTTPS
+# connection pool, instead of paying a fresh TLS handshake per instance.
+_SESSION_CACHE: dict[tuple, boto3.session.Session] = {}
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session(
+        aws_access_key_id: str | None,
+        aws_secret_access_key: str | None,
+        region_name: str | None
+) -> boto3.session.Session:
+    key = (aws_access_key_id, region_name)
+    with _SESSION_LOCK:
+        session = _SESSION_CACHE.get(key)
+        if session is None:
+            session = boto3.session.Session(
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                region_name=region_name
+            )
+            _SESSION_CACHE[key] = session
+    return session
+
+
+# Secrets are kept out of the memoisation key below - the key carries only a
+# digest, resolved back to the real secret through this map.
+_SECRETS: dict[str | None, str | None] = {None: None}
+
+
+def _hash_secret(secret: str | None) -> str | None:
+    if secret is None:
+        return None
+    digest = hashlib.sha256(secret.encode()).hexdigest()
+    _SECRETS[digest] = secret
+    return digest
+
+
+@functools.lru_cache(maxsize=64)
+def _build_client(
+        aws_access_key_id: str | None,
+        secret_hash: str | None,
+        region_name: str | None
+):
+    session = _get_session(
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=_SECRETS[secret_hash],
+        region_name=region_name
+    )
+    # Pool sized to cover the TransferConfig concurrency, with adaptive
+    # retries for throttled calls.
+    return session.client(
+        's3',
+        config=botocore.config.Config(
+            max_pool_connections=50,
+            retries={
+                'max_attempts': 3,
+                'mode': 'adaptive'
+            }
+        )
+    )
+
+
+class AWSS3Handler(BaseHandler):
+    """
+    A handler class for managing interactions with an AWS S3 bucket.
+    This class extends BaseHandler and provides methods to upload, download and list objects
+    in the configured bucket, facilitating file storage and retrieval operations.
+    """
+
+    def __init__(
+            self,
+            *,
+            bucket_name: str,
+            aws_access_key_id: str | None = None,
+            aws_secret_access_key: str | None = None,
+            region_name: str | None = None,
+            max_pool_workers: int = 8,
+            use_async_client: bool = False
+    ):
+        super().__init__()
+        self.bucket_name = bucket_name
+        self._aws_access_key_id = aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID")
+        self._aws_secret_access_key = aws_secret_access_key or os.getenv("AWS_SECRET_ACCESS_KEY")
+        self._region_name = region_name or os.getenv("AWS_REGION")
+        self._storage = _build_client(
+            aws_access_key_id=self._aws_access_key_id,
+            secret_hash=_hash_secret(self._aws_secret_access_key),
+            region_name=self._region_name
+        )
+        # Multipart concurrent transfers keep large objects from serialising
+        # part by part over high latency links.
+        self._transfer_config = TransferConfig(
+            multipart_threshold=8 * _MB,
+            multipart_chunksize=8 * _MB,
+            max_concurrency=10,
+            use_threads=True
+        )
+        # Dedicated pool for aupload_file / adownload_file, so transfers can be
+        # scheduled now and awaited later while the caller keeps producing.
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=max_pool_workers)
+        self._pending: dict[str, asyncio.Future] = {}
+        # Optional aiobotocore path - drives S3 straight from the event loop,
+        # skipping the thread handoff when transferring many small objects.
+        self._use_async_client = use_async_client
+        self._async_client = None
+        self._async_client_cm = None
+        self._async_client_lock = asyncio.Lock()
+
+    def _upload_stream(
+            self,
+            file_name: str,
+            object_name: str,
+            want_checksum: bool = False
+    ):
+        # Stream from one open handle - upload_fileobj seeks/slices parts out
+        # of it directly, so the file is read once end to end instead of once
+        # for hashing and again for transfer.
+        with open(file_name, 'rb') as fh:
+            return self._storage.upload_fileobj(
+                fh,
+                self.bucket_name,
+                object_name,
+                Config=self._transfer_config,
+                ExtraArgs={'ChecksumAlgorithm': 'CRC32'} if want_checksum else None
+            )
+
+    @tool
+    async def upload_file(
+            self,
+            file_name: str,
+            object_name: str | None = None,
+            want_checksum: bool = False
+    ):
+        """
+        Asynchronously uploads the given file to the configured S3 bucket. The file is streamed
+        from a single open handle and large files are split into parts transferred concurrently
+        over a thread pool.
+
+        parameter:
+            file_name(str):The path of the file to upload.
+            object_name(str or None, optional):The S3 object name to store the file as. If not given,
+            the base name of `file_name` is used.
+            want_checksum(bool, optional):Set True to attach a CRC32 checksum to the upload.
+            Defaults to False, skipping the extra client-side hashing pass.
+
+        """
+        if object_name is None:
+            object_name = os.path.basename(file_name)
+        try:
+            return await sync_to_async(
+                self._upload_stream,
+                file_name=file_name,
+                object_name=object_name,
+                want_checksum=want_checksum
+            )
+        except ClientError as ex:
+            logger.error(f'S3 file upload failed! {ex}')
+
+    @tool
+    async def download_file(
+            self,
+            object_name: str,
+            file_name: str | None = None
+    ):
+        """
+        Asynchronously downloads the given object from the configured S3 bucket. Large objects are
+        fetched with ranged GETs in parallel using the shared transfer configuration.
+
+        parameter:
+            object_name(str):The S3 object name to download.
+            file_name(str or None, optional):The local path to store the downloaded file. If not given,
+            the object name is used.
+
+        """
+        if file_name is None:
+            file_name = object_name
+        try:
+            return await sync_to_async(
+                self._storage.download_file,
+                Bucket=self.bucket_name,
+                Key=object_name,
+                Filename=file_name,
+                Config=self._transfer_config
+            )
+        except ClientError as ex:
+            logger.error(f'S3 file download failed! {ex}')
+
+    def _upload_with_retry(
+            self,
+            file_name: str,
+            object_name: str
+    ):
+        for _attempt in range(3):
+            try:
+                return self._upload_stream(
+                    file_name=file_name,
+                    object_name=object_name
+                )
+            except ClientError as ex:
+                logger.warning(f'S3 file upload attempt {_attempt + 1} failed! {ex}')
+                if _attempt == 2:
+                    raise
+                time.sleep(2 ** _attempt)
+
+    def _download_with_retry(
+            self,
+            object_name: str,
+            file_name: str
+    ):
+        for _attempt in range(3):
+            try:
+                return self._storage.download_file(
+                    Bucket=self.bucket_name,
+                    Key=object_name,
+                    Filename=file_name,
+                    Config=self._transfer_config
+                )
+            except ClientError as ex:
+                logger.warning(f'S3 file download attempt {_attempt + 1} failed! {ex}')
+                if _attempt == 2:
+                    raise
+                time.sleep(2 ** _attempt)
+
+    async def _get_async_client(self):
+        if self._async_client is None:
+            async with self._async_client_lock:
+                if self._async_client is None:
+                    # Lazy import - aiobotocore is only needed when the async
+                    # client path is switched on.
+                    from aiobotocore.session import get_session
+                    self._async_client_cm = get_session().create_client(
+                        's3',
+                        aws_access_key_id=self._aws_access_key_id,
+                        aws_secret_access_key=self._aws_secret_access_key,
+                        region_name=self._region_name
+                    )
+                    self._async_client = await self._async_client_cm.__aenter__()
+        return self._async_client
+
+    async def _aput_object(
+            self,
+            file_name: str,
+            object_name: str
+    ):
+        client = await self._get_async_client()
+        with open(file_name, 'rb') as fh:
+            return await client.put_object(
+                Bucket=self.bucket_name,
+                Key=object_name,
+                Body=fh.read()
+            )
+
+    async def _aget_object(
+            self,
+            object_name: str,
+            file_name: str
+    ):
+        client = await self._get_async_client()
+        res = await client.get_object(
+            Bucket=self.bucket_name,
+            Key=object_name
+        )
+        async with res['Body'] as stream:
+            body = await stream.read()
+        with open(file_name, 'wb') as fh:
+            fh.write(body)
+
+    async def aclose(self) -> None:
+        """
+        Closes the aiobotocore client if the async path was used.
+
+        """
+        if self._async_client_cm is not None:
+            await self._async_client_cm.__aexit__(None, None, None)
+            self._async_client = None
+            self._async_client_cm = None
+
+    async def __aenter__(self) -> 'AWSS3Handler':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        # Settle any transfers still in flight, then release per-instance
+        # resources. The memoised boto3 client is left open - it is shared
+        # with other handler instances using the same credentials.
+        await self.await_pending()
+        await self.aclose()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def aupload_file(
+            self,
+            file_name: str,
+            object_name: str | None = None
+    ) -> asyncio.Future:
+        """
+        Schedules an upload of the given file and returns the future without waiting for it. The
+        caller can carry on with the next piece of work and await the future (or `await_pending`)
+        later, overlapping the S3 transfer with its own compute. With `use_async_client` set, the
+        transfer runs on the event loop via aiobotocore instead of hopping to the thread pool -
+        worthwhile for bursts of many small objects.
+
+        parameter:
+            file_name(str):The path of the file to upload.
+            object_name(str or None, optional):The S3 object name to store the file as. If not given,
+            the base name of `file_name` is used.
+
+        """
+        if object_name is None:
+            object_name = os.path.basename(file_name)
+        if self._use_async_client:
+            future = asyncio.ensure_future(
+                self._aput_object(
+                    file_name=file_name,
+                    object_name=object_name
+                )
+            )
+        else:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._pool,
+                self._upload_with_retry,
+                file_name,
+                object_name
+            )
+        self._pending[object_name] = future
+        return future
+
+    async def adownload_file(
+            self,
+            object_name: str,
+            file_name: str | None = None
+    ) -> asyncio.Future:
+        """
+        Schedules a download of the given object and returns the future without waiting for it,
+        letting the caller overlap the S3 transfer with its own work before awaiting the result.
+        With `use_async_client` set, the transfer runs on the event loop via aiobotocore instead
+        of hopping to the thread pool.
+
+        parameter:
+            object_name(str):The S3 object name to download.
+            file_name(str or None, optional):The local path to store the downloaded file. If not given,
+            the object name is used.
+
+        """
+        if file_name is None:
+            file_name = object_name
+        if self._use_async_client:
+            future = asyncio.ensure_future(
+                self._aget_object(
+                    object_name=object_name,
+                    file_name=file_name
+                )
+            )
+        else:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._pool,
+                self._download_with_retry,
+                object_name,
+                file_name
+            )
+        self._pending[object_name] = future
+        return future
+
+    async def await_pending(self) -> list:
+        """
+        Awaits all transfers previously scheduled with `aupload_file` / `adownload_file` and
+        clears the pending set, returning their results in scheduling order.
+
+        """
+        if not self._pending:
+            return []
+        futures = list(self._pending.values())
+        self._pending.clear()
+        return await asyncio.gather(*futures)
+
+    @tool
+    async def presign(
+            self,
+            action: Literal['upload', 'download'],
+            object_name: str,
+            expires: int = 3600,
+            content_type: str | None = None
+    ) -> str | None:
+        """
+        Asynchronously generates a presigned URL for the given object, letting the caller upload or
+        download bytes straight to S3 so the data never passes through this process.
+
+        parameter:
+            action(str):The transfer direction, either `upload` (presigned PUT) or `download` (presigned GET).
+            object_name(str):The S3 object name the URL grants access to.
+            expires(int, optional):The number of seconds the URL stays valid. Defaults to 3600.
+            content_type(str or None, optional):The content type the upload must declare. Defaults to None.
+
+        """
+        params = {
+            'Bucket': self.bucket_name,
+            'Key': object_name
+        }
+        if action == 'upload' and content_type:
+            params['ContentType'] = content_type
+        try:
+            return await sync_to_async(
+                self._storage.generate_presigned_url,
+                ClientMethod='put_object' if action == 'upload' else 'get_object',
+                Params=params,
+                ExpiresIn=expires
+            )
+        except ClientError as ex:
+            logger.error(f'S3 presign failed! {ex}')
+
+    @tool
+    async def presign_batch(
+            self,
+            object_names: list[str],
+            action: Literal['upload', 'download'] = 'upload',
+            expires: int = 3600
+    ) -> dict[str, str]:
+        """
+        Asynchronously generates presigned URLs for a batch of objects, for upload-session style
+        workflows where many keys are handed out at once.
+
+        parameter:
+            object_names(list[str]):The S3 object names to presign.
+            action(str, optional):The transfer direction, either `upload` or `download`. Defaults to `upload`.
+            expires(int, optional):The number of seconds each URL stays valid. Defaults to 3600.
+
+        """
+        urls = {}
+        async for _object_name in iter_to_aiter(object_names):
+            url = await self.presign(
+                action=action,
+                object_name=_object_name,
+                expires=expires
+            )
+            if url:
+                urls[_object_name] = url
+        return urls
+
+    @tool
+    async def list_buckets(self):
+        """
+        Asynchronously lists the buckets of the configured AWS account.
+
+        """
+        try:
+            res = await sync_to_async(self._storage.list_buckets)
+            return res.get('Buckets', [])
+        except ClientError as ex:
+            logger.error(f'S3 bucket list failed! {ex}')
+
+    async def list_objects(
+            self,
+            prefix: str | None = None,
+            page_size: int = 1000
+    ):
+        """
+        Asynchronously iterates the objects of the configured bucket page by page, yielding one
+        object entry at a time so large buckets never load every key into memory.
+
+        parameter:
+            prefix(str or None, optional):Limits the listing to keys starting with the prefix.
+            Defaults to None.
+            page_size(int, optional):The number of keys fetched per page. Defaults to 1000.
+
+        """
+        paginator = self._storage.get_paginator('list_objects_v2')
+        pages = iter(
+            paginator.paginate(
+                Bucket=self.bucket_name,
+                Prefix=prefix or '',
+                PaginationConfig={'PageSize': page_size}
+            )
+        )
+        while True:
+            page = await sync_to_async(next, pages, None)
+            if page is None:
+                break
+            for item in page.get('Contents', []):
+                yield item
+
+    async def alist_objects(
+            self,
+            prefix: str | None = None,
+            page_size: int = 1000
+    ):
+        """
+        Asynchronously iterates the objects of the configured bucket over the aiobotocore client,
+        prefetching the next page while the caller consumes the current one.
+
+        parameter:
+            prefix(str or None, optional):Limits the listing to keys starting with the prefix.
+            Defaults to None.
+            page_size(int, optional):The number of keys fetched per page. Defaults to 1000.
+
+        """
+        client = await self._get_async_client()
+        paginator = client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix or '',
+            PaginationConfig={'PageSize': page_size}
+        ).__aiter__()
+        next_page = asyncio.ensure_future(anext(pages, None))
+        while True:
+            page = await next_page
+            if page is None:
+                break
+            # Fetch the next page while the caller works through this one.
+            next_page = asyncio.ensure_future(anext(pages, None))
+            for item in page.get('Contents', []):
+                yield item
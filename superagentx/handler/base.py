@@ -1,18 +1,29 @@
 import abc
 import inspect
+from types import MappingProxyType
 
 
 # Base Class
 class BaseHandler(abc.ABC):
     tools = []
+    # Frozen per-subclass table of tool name -> (function, is_coroutine),
+    # built once at class-creation time.
+    _TOOL_TABLE: MappingProxyType = MappingProxyType({})
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Scan the MRO once when the subclass is created; instances then reuse
+        # the frozen table instead of re-walking their members with inspect.
+        _table = {}
+        for _klass in reversed(cls.__mro__):
+            for _name, _member in vars(_klass).items():
+                if callable(_member) and getattr(_member, '_is_handler_tool', False):
+                    _table[_name] = (_member, inspect.iscoroutinefunction(_member))
+        cls._TOOL_TABLE = MappingProxyType(dict(sorted(_table.items())))
 
     def __init__(self):
         self._get_tools()
 
     def _get_tools(self) -> list[str]:
-        self.tools = []
-        for _name, _member in inspect.getmembers(self):
-            if inspect.isfunction(_member) or inspect.ismethod(_member):
-                if hasattr(_member, '_is_handler_tool') and getattr(_member, '_is_handler_tool'):
-                    self.tools.append(_member.__name__)
+        self.tools = list(self._TOOL_TABLE)
         return self.tools
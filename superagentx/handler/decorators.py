@@ -6,4 +6,11 @@ def tool(func):
     async def wrapper(*args, **kwargs):
         return await func(*args, **kwargs)
     wrapper._is_handler_tool = True
-    return wrapper
\ No newline at end of file
+    return wrapper
+
+
+def non_blocking(func):
+    # Marks a sync tool as CPU-trivial, letting the engine call it directly
+    # on the event loop instead of paying a thread-pool hop.
+    func._blocking = False
+    return func
\ No newline at end of file
@@ -0,0 +1,319 @@
+import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import logging
+import os
+import threading
+from typing import Callable
+
+import cachetools
+from jira import JIRA
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from superagentx.handler.base import BaseHandler
+from superagentx.handler.decorators import tool
+
+logger = logging.getLogger(__name__)
+
+# One pooled HTTP adapter per organization, shared across handler instances,
+# so repeated Jira calls reuse warm TLS connections instead of re-handshaking.
+_JIRA_ADAPTERS: dict[str, HTTPAdapter] = {}
+
+
+def _get_adapter(organization: str) -> HTTPAdapter:
+    adapter = _JIRA_ADAPTERS.get(organization)
+    if adapter is None:
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=50,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504]
+            )
+        )
+        _JIRA_ADAPTERS[organization] = adapter
+    return adapter
+
+
+# Tokens are kept out of the memoisation key below - the key carries only a
+# digest, resolved back to the real token through this map.
+_TOKENS: dict[str | None, str | None] = {None: None}
+
+
+def _hash_token(token: str | None) -> str | None:
+    if token is None:
+        return None
+    digest = hashlib.sha256(token.encode()).hexdigest()
+    _TOKENS[digest] = token
+    return digest
+
+
+@functools.lru_cache(maxsize=64)
+def _build_jira_client(
+        email: str | None,
+        organization: str | None,
+        token_hash: str | None
+) -> JIRA:
+    jira = JIRA(
+        server=f'https://{organization}.atlassian.net',
+        basic_auth=(email, _TOKENS[token_hash]),
+        # Skip the extra server-info round trip on connect.
+        get_server_info=False
+    )
+    # Mount the org-wide pooled adapter so every handler instance for this
+    # organization shares one warm connection pool.
+    jira._session.mount('https://', _get_adapter(organization))
+    return jira
+
+
+class AuthException(Exception):
+    pass
+
+
+class JiraHandler(BaseHandler):
+    """
+    A handler class for managing interactions with the Jira REST API.
+    This class extends BaseHandler and provides methods to retrieve projects, sprints and issues
+    and to move issues between sprints, facilitating project tracking operations.
+    """
+
+    def __init__(
+            self,
+            *,
+            email: str | None = None,
+            token: str | None = None,
+            organization: str | None = None
+    ):
+        super().__init__()
+        self.email = email or os.getenv("ATLASSIAN_EMAIL")
+        self.token = token or os.getenv("ATLASSIAN_TOKEN")
+        self.organization = organization or os.getenv("ATLASSIAN_ORGANIZATION")
+        self._connection: JIRA = self._connect()
+        # Short lived cache for read calls; projects, sprints and issue
+        # payloads are near static within the TTL window.
+        self._cache = cachetools.TTLCache(maxsize=1024, ttl=60)
+        self._cache_lock = threading.Lock()
+        # Dedicated worker pool sized to the mounted HTTP pool, so queued Jira
+        # calls neither starve the shared default executor nor overflow the
+        # connection pool.
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=50,
+            thread_name_prefix='jira'
+        )
+
+    def _connect(self) -> JIRA:
+        try:
+            jira = _build_jira_client(
+                email=self.email,
+                organization=self.organization,
+                token_hash=_hash_token(self.token)
+            )
+            logger.info('Jira authenticate success')
+            return jira
+        except Exception as ex:
+            message = f'Jira Handler Authentication Problem! {ex}'
+            logger.error(message, exc_info=ex)
+            raise AuthException(message)
+
+    async def _run(
+            self,
+            func: Callable,
+            **kwargs
+    ):
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            functools.partial(func, **kwargs)
+        )
+
+    def close(self) -> None:
+        """
+        Shuts down the handler's worker pool and drops its cache. Call when the handler is
+        no longer needed. The pooled HTTP session is left open - it is shared with other
+        handler instances of the same organization.
+
+        """
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        with self._cache_lock:
+            self._cache.clear()
+
+    async def __aenter__(self) -> 'JiraHandler':
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self.close()
+
+    async def _cached(
+            self,
+            key: tuple,
+            producer: Callable,
+            **kwargs
+    ):
+        with self._cache_lock:
+            if key in self._cache:
+                logger.debug(f'Jira cache hit : {key}')
+                return self._cache[key]
+        result = await self._run(producer, **kwargs)
+        with self._cache_lock:
+            self._cache[key] = result
+        return result
+
+    def invalidate(
+            self,
+            prefix: str | None = None
+    ) -> None:
+        """
+        Drops cached read results, either every entry or only those whose key starts with the
+        given prefix. Call after mutating calls so subsequent reads see fresh data.
+
+        parameter:
+            prefix(str or None, optional):The key prefix to drop (e.g. `issue`). Defaults to None,
+            which clears the whole cache.
+
+        """
+        with self._cache_lock:
+            if prefix is None:
+                self._cache.clear()
+            else:
+                for _key in [_key for _key in self._cache if _key[0] == prefix]:
+                    del self._cache[_key]
+
+    @tool
+    async def get_list_projects(self):
+        """
+        Asynchronously retrieves the list of projects visible to the authenticated user.
+
+        """
+        return await self._cached(
+            key=('projects',),
+            producer=self._connection.projects
+        )
+
+    @tool
+    async def get_active_sprint(
+            self,
+            *,
+            board_id: int,
+            start: int = 0,
+            size: int = 50
+    ):
+        """
+        Asynchronously retrieves the active sprint(s) of the given board.
+
+        parameter:
+            board_id(int):The id of the board to look up.
+            start(int, optional):The starting index of the returned sprints, used for pagination. Defaults to 0.
+            size(int, optional):The maximum number of sprints to return. Defaults to 50.
+
+        """
+        return await self._cached(
+            key=('active_sprint', board_id, start, size),
+            producer=self._connection.sprints,
+            board_id=board_id,
+            startAt=start,
+            maxResults=size,
+            state='active'
+        )
+
+    def _get_issue_raw(
+            self,
+            issue_id: str,
+            fields: str | None = None,
+            expand: str | None = None
+    ) -> dict:
+        # Direct REST GET over the pooled session - returns the payload dict
+        # without materialising the jira library's Issue wrapper.
+        params = {}
+        if fields:
+            params['fields'] = fields
+        if expand:
+            params['expand'] = expand
+        resp = self._connection._session.get(
+            f'{self._connection._options["server"]}/rest/api/2/issue/{issue_id}',
+            params=params or None
+        )
+        resp.raise_for_status()
+        return resp.json()
+
+    @tool
+    async def get_issue(
+            self,
+            *,
+            issue_id: str,
+            fields: list[str] | None = None,
+            expand: str | None = None,
+            wrap: bool = False
+    ):
+        """
+        Asynchronously retrieves the given issue. Selecting only the needed fields
+        (e.g. `summary,status,assignee,priority` for listing pages) cuts the payload down from the
+        full issue body, which for issues with worklogs and comments is often the bulk of the bytes.
+
+        parameter:
+            issue_id(str):The id or key of the issue to retrieve.
+            fields(list[str] or None, optional):The field names to fetch. Defaults to None,
+            which fetches every field.
+            expand(str or None, optional):The extra issue parts to expand (e.g. `changelog`).
+            Defaults to None.
+            wrap(bool, optional):Set True to get the jira library's Issue object instead of the
+            plain payload dict. Defaults to False.
+
+        """
+        _fields = ','.join(fields) if fields else None
+        if wrap:
+            return await self._cached(
+                key=('issue', issue_id, _fields, expand, 'wrap'),
+                producer=self._connection.issue,
+                id=issue_id,
+                fields=_fields,
+                expand=expand
+            )
+        return await self._cached(
+            key=('issue', issue_id, _fields, expand),
+            producer=self._get_issue_raw,
+            issue_id=issue_id,
+            fields=_fields,
+            expand=expand
+        )
+
+    @tool
+    async def add_issue_to_sprint(
+            self,
+            *,
+            board_id: int,
+            issue_keys: list[str]
+    ):
+        """
+        Asynchronously moves the given issues into the active sprint of the given board.
+
+        parameter:
+            board_id(int):The id of the board whose active sprint receives the issues.
+            issue_keys(list[str]):The keys of the issues to move (e.g. `PROJ-123`).
+
+        """
+        current_sprint = await self.get_active_sprint(
+            board_id=board_id
+        )
+        if not current_sprint:
+            return []
+        _sem = asyncio.Semaphore(5)
+
+        async def _add_to_sprint(sprint):
+            async with _sem:
+                return await self._run(
+                    self._connection.add_issues_to_sprint,
+                    sprint_id=sprint.id,
+                    issue_keys=issue_keys
+                )
+
+        res = await asyncio.gather(
+            *[
+                _add_to_sprint(sprint)
+                for sprint in current_sprint
+            ]
+        )
+        self.invalidate(prefix='issue')
+        self.invalidate(prefix='active_sprint')
+        return res
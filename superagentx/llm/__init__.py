@@ -1,3 +1,4 @@
+import asyncio
 import json
 import logging
 import os
@@ -6,7 +7,7 @@ from typing import List
 
 import boto3
 from botocore.config import Config
-from openai import OpenAI, AzureOpenAI, AsyncOpenAI, AsyncAzureOpenAI
+from openai import OpenAI, AzureOpenAI, AsyncOpenAI, AsyncAzureOpenAI, APIConnectionError, InternalServerError, RateLimitError
 from openai.types.chat import ChatCompletion
 
 from superagentx.exceptions import InvalidType
@@ -47,10 +48,14 @@ class LLMClient:
             self,
             *,
             llm_config: dict,
+            max_concurrent: int = 8,
             **kwargs
     ):
         self.llm_config = llm_config
         self.llm_config_model = LLMModelConfig(**self.llm_config)
+        # Bound in-flight completions so a burst of callers saturates, rather
+        # than overwhelms, the provider's rate limit.
+        self._sem = asyncio.Semaphore(max_concurrent)
 
         match self.llm_config_model.llm_type:
 
@@ -156,7 +161,23 @@ class LLMClient:
             *,
             chat_completion_params: ChatCompletionParams
     ) -> ChatCompletion:
-        return await self.client.achat_completion(chat_completion_params=chat_completion_params)
+        async with self._sem:
+            for _attempt in range(3):
+                try:
+                    return await self.client.achat_completion(chat_completion_params=chat_completion_params)
+                except (RateLimitError, APIConnectionError, InternalServerError) as ex:
+                    if _attempt == 2:
+                        raise
+                    logger.warning(f'Chat completion attempt {_attempt + 1} failed! Retrying... {ex}')
+                    await asyncio.sleep(2 ** _attempt)
+
+    async def astream_chat_completion(
+            self,
+            *,
+            chat_completion_params: ChatCompletionParams
+    ):
+        async for chunk in self.client.astream_chat_completion(chat_completion_params=chat_completion_params):
+            yield chunk
 
     async def get_tool_json(
             self,
@@ -187,6 +208,32 @@ class LLMClient:
             **kwargs
         )
 
+    def embed_many(
+            self,
+            *,
+            texts: list[str],
+            batch_size: int = 96,
+            **kwargs
+    ):
+        return self.client.embed_many(
+            texts,
+            batch_size=batch_size,
+            **kwargs
+        )
+
+    async def aembed_many(
+            self,
+            *,
+            texts: list[str],
+            batch_size: int = 96,
+            **kwargs
+    ):
+        return await self.client.aembed_many(
+            texts,
+            batch_size=batch_size,
+            **kwargs
+        )
+
     async def afunc_chat_completion(
             self,
             *,
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+
+from superagentx.llm import LLMClient
+from superagentx.llm.models import ChatCompletionParams
+
+logger = logging.getLogger(__name__)
+
+
+class BatchingLLMClient:
+    """
+    An opt-in request collector around `LLMClient` that coalesces chat completions issued within
+    a short window and dispatches them together, amortizing the per-request fixed overhead
+    (connection, auth, encoding) across the whole batch on bulk runs.
+
+    It exposes the `LLMClient` call surface used by engines and agents, so a single instance
+    can be handed to every `Engine`/`Agent` of an `AgentXPipe` as their `llm` - concurrent
+    calls from parallel engines then share one batching window and semaphore.
+    """
+
+    def __init__(
+            self,
+            *,
+            llm: LLMClient,
+            batch_size: int = 32,
+            batch_window_ms: int = 20,
+            max_concurrent: int = 8
+    ):
+        """
+        Initializes a new instance of the BatchingLLMClient class.
+
+        Args:
+            llm: Interface for communicating with the large language model (LLM).
+            batch_size: The maximum number of queued completions drained into one dispatch.
+                Defaults to 32.
+            batch_window_ms: The number of milliseconds the collector waits for more requests
+                to arrive before dispatching a partial batch. Defaults to 20.
+            max_concurrent: The maximum number of in-flight provider calls per dispatched batch.
+                Defaults to 8.
+        """
+        self.llm = llm
+        self.batch_size = batch_size
+        self.batch_window_ms = batch_window_ms
+        self._sem = asyncio.Semaphore(max_concurrent)
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._collector: asyncio.Task | None = None
+
+    @property
+    def llm_config(self) -> dict:
+        return self.llm.llm_config
+
+    async def get_tool_json(
+            self,
+            *,
+            func
+    ) -> dict:
+        return await self.llm.get_tool_json(func=func)
+
+    async def achat_completion(
+            self,
+            *,
+            chat_completion_params: ChatCompletionParams
+    ):
+        """
+        Queues the given chat completion for the next batch dispatch and awaits its result.
+        Requests queued within the same batch window share one drain cycle instead of each
+        paying the dispatch overhead alone.
+
+        Args:
+            chat_completion_params: Parameters for the chat completion using `ChatCompletionParams`.
+        """
+        return await self._submit(
+            method='achat_completion',
+            chat_completion_params=chat_completion_params
+        )
+
+    async def afunc_chat_completion(
+            self,
+            *,
+            chat_completion_params: ChatCompletionParams
+    ):
+        """
+        Queues the given tool-calling completion for the next batch dispatch and awaits its
+        result, so engines sharing this client coalesce their concurrent calls into one
+        drain cycle.
+
+        Args:
+            chat_completion_params: Parameters for the chat completion using `ChatCompletionParams`.
+        """
+        return await self._submit(
+            method='afunc_chat_completion',
+            chat_completion_params=chat_completion_params
+        )
+
+    async def _submit(
+            self,
+            method: str,
+            chat_completion_params: ChatCompletionParams
+    ):
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((method, chat_completion_params, future))
+        if self._collector is None or self._collector.done():
+            self._collector = asyncio.create_task(self._collect())
+        return await future
+
+    async def _collect(self):
+        while not self._queue.empty():
+            batch = [await self._queue.get()]
+            window = self.batch_window_ms / 1000
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(
+                            self._queue.get(),
+                            timeout=window
+                        )
+                    )
+                except asyncio.TimeoutError:
+                    break
+            logger.debug(f'Dispatching LLM batch of {len(batch)}')
+            await asyncio.gather(
+                *[
+                    self._dispatch(
+                        method=_method,
+                        chat_completion_params=_params,
+                        future=_future
+                    )
+                    for _method, _params, _future in batch
+                ]
+            )
+
+    async def _dispatch(
+            self,
+            method: str,
+            chat_completion_params: ChatCompletionParams,
+            future: asyncio.Future
+    ):
+        async with self._sem:
+            try:
+                result = await getattr(self.llm, method)(
+                    chat_completion_params=chat_completion_params
+                )
+                if not future.done():
+                    future.set_result(result)
+            except Exception as ex:
+                if not future.done():
+                    future.set_exception(ex)
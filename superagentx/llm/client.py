@@ -21,6 +21,67 @@ class Client(metaclass=ABCMeta):
     ):
         raise NotImplementedError
 
+    def embed_many(
+            self,
+            texts: list[str],
+            *,
+            batch_size: int = 96,
+            **kwargs
+    ) -> list[list]:
+        """
+        Get the embeddings for the given texts using Client. Providers with a native
+        batch endpoint override this to amortize the per-call overhead; the default
+        falls back to one call per text.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            batch_size (int): The number of texts sent per provider call.
+
+        Returns:
+            list: The embedding vectors, aligned with the input order.
+        """
+        return [
+            self.embed(text, **kwargs)
+            for text in texts
+        ]
+
+    async def aembed_many(
+            self,
+            texts: list[str],
+            *,
+            batch_size: int = 96,
+            **kwargs
+    ) -> list[list]:
+        """
+        Get the embeddings for the given texts using Client. Providers with a native
+        batch endpoint override this to amortize the per-call overhead; the default
+        falls back to one call per text.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            batch_size (int): The number of texts sent per provider call.
+
+        Returns:
+            list: The embedding vectors, aligned with the input order.
+        """
+        return [
+            await self.aembed(text, **kwargs)
+            for text in texts
+        ]
+
+    async def astream_chat_completion(
+            self,
+            *args,
+            **kwargs
+    ):
+        """
+        Stream the chat completion for the given params, yielding content chunks as the
+        model produces them. Optional - clients without provider streaming support keep
+        this default.
+        """
+        raise NotImplementedError
+        yield  # pragma: no cover - marks this default as an async generator
+
     @abstractmethod
     async def get_tool_json(
             self,
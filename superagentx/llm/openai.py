@@ -67,6 +67,78 @@ class OpenAIClient(Client):
         chat_completion_response = await self.client.chat.completions.create(**params)
         return chat_completion_response
 
+    def embed_many(
+            self,
+            texts: list[str],
+            *,
+            batch_size: int = 96,
+            **kwargs
+    ) -> list[list[float]]:
+        """
+        Get the embeddings for the given texts using OpenAI | AzureOpenAI. Texts are sent
+        in provider-native batches so one round-trip returns up to `batch_size` vectors.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            batch_size (int): The number of texts sent per request.
+
+        Returns:
+            list: The embedding vectors, aligned with the input order.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings = []
+        for _start in range(0, len(texts), batch_size):
+            response = self.client.embeddings.create(
+                input=texts[_start:_start + batch_size],
+                model=self._embed_model,
+                **kwargs
+            )
+            embeddings.extend(_data.embedding for _data in response.data)
+        return embeddings
+
+    async def aembed_many(
+            self,
+            texts: list[str],
+            *,
+            batch_size: int = 96,
+            **kwargs
+    ) -> list[list[float]]:
+        """
+        Get the embeddings for the given texts using AsyncOpenAI | AsyncAzureOpenAI. Texts
+        are sent in provider-native batches so one round-trip returns up to `batch_size`
+        vectors.
+
+        Args:
+            texts (list[str]): The texts to embed.
+            batch_size (int): The number of texts sent per request.
+
+        Returns:
+            list: The embedding vectors, aligned with the input order.
+        """
+        texts = [text.replace("\n", " ") for text in texts]
+        embeddings = []
+        for _start in range(0, len(texts), batch_size):
+            response = await self.client.embeddings.create(
+                input=texts[_start:_start + batch_size],
+                model=self._embed_model,
+                **kwargs
+            )
+            embeddings.extend(_data.embedding for _data in response.data)
+        return embeddings
+
+    async def astream_chat_completion(
+            self,
+            *,
+            chat_completion_params: ChatCompletionParams
+    ):
+        params = chat_completion_params.model_dump(exclude_none=True)
+        params['model'] = self._model  # Get model name from client object attribute and set
+        params['stream'] = True
+        response = await self.client.chat.completions.create(**params)
+        async for chunk in response:
+            if chunk.choices and chunk.choices[0].delta:
+                yield chunk.choices[0].delta.content or ''
+
     @staticmethod
     def _get_embeddings(response: CreateEmbeddingResponse):
         if response and response.data:
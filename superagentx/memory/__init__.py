@@ -49,11 +49,61 @@ class Memory(MemoryBase):
             await db.add_history(*args, **kwargs)
         await self._add_to_vector_store(*args, **kwargs)
 
+    @final
+    async def add_many(self, records: list[dict]):
+        """
+        Adds a batch of messages in one shot - a single history connection and one
+        vector-store insert covering every record, instead of per-message round trips.
+
+        Args:
+            records: Keyword sets as accepted by `add` (memory_id, chat_id, message_id,
+                role, data, reason and optional timestamps).
+        """
+        if not records:
+            return
+        async with self.db as db:
+            for _record in records:
+                await db.add_history(**_record)
+        now = datetime.datetime.now()
+        payloads = []
+        for _record in records:
+            payloads.append(
+                {
+                    "memory_id": _record["memory_id"],
+                    "data": _record["data"],
+                    "reason": _record["reason"],
+                    "chat_id": _record["chat_id"],
+                    "message_id": _record["message_id"],
+                    "role": _record["role"],
+                    "created_at": str(_record.get("created_at") or now),
+                    "updated_at": str(_record.get("updated_at") or now),
+                    "is_deleted": _record.get("is_deleted", False)
+                }
+            )
+        await self.vector_db.insert(
+            texts=[_record["data"] for _record in records],
+            payloads=payloads,
+            ids=[_record["message_id"] for _record in records]
+        )
+
     @final
     async def get(self, *args, **kwargs):
         async with self.db as db:
             return await db.get_history(*args, **kwargs)
 
+    @final
+    async def has_any(self, memory_id: str, chat_id: str) -> bool:
+        """
+        Checks whether any history exists for the given memory/chat pair - a cheap
+        COUNT-style probe callers can use to skip the vector search entirely on
+        fresh sessions.
+        """
+        async with self.db as db:
+            return await db.has_history(
+                memory_id=memory_id,
+                chat_id=chat_id
+            )
+
     @final
     async def update(self, memory_id, data):
         pass
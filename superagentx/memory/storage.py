@@ -118,6 +118,33 @@ class SQLiteManager:
                 async for row in iter_to_aiter(rows)
             ]
 
+    async def has_history(
+            self,
+            *,
+            memory_id: str,
+            chat_id: str
+    ) -> bool:
+        """
+        Asynchronously checks whether any chat history exists for the given user and chat
+        session - a cheap existence probe to run before the expensive retrieval paths.
+
+        Parameters:
+            memory_id : str
+                The unique identifier of the user whose chat history is being checked.
+            chat_id : str
+                The unique identifier of the chat session to check.
+        """
+        cursor = await self.connection.execute(
+            """
+            SELECT 1
+            FROM history
+            WHERE memory_id = ? AND chat_id = ?
+            LIMIT 1
+        """,
+            (memory_id, chat_id),
+        )
+        return await cursor.fetchone() is not None
+
     async def _get_user_by_id(
             self,
             memory_id: str
@@ -34,6 +34,10 @@ class PromptTemplate:
         self.system_message = system_message
         if self.prompt_type is None:
             self.prompt_type = "default"
+        # Rendered message lists keyed by prompt + kwargs - structurally
+        # identical calls (every agent retry) reuse the built list instead of
+        # re-formatting. Copies are handed out so callers can't mutate entries.
+        self._messages_cache: dict[tuple, list[dict]] = {}
 
     async def _get_prompt(self) -> list[dict]:
         match self.prompt_type:
@@ -55,9 +59,19 @@ class PromptTemplate:
             input_prompt (str): Give the instruction of your expected result.
             kwargs (Any): Format the variable's value in the given prompt.
         """
-        prompt = await self._get_prompt()
         if not kwargs:
             kwargs = {}
+        try:
+            cache_key = (input_prompt, tuple(sorted(kwargs.items())))
+            cached = self._messages_cache.get(cache_key)
+        except TypeError:
+            # Unhashable kwargs value - skip the cache for this call.
+            cache_key = None
+            cached = None
+        if cached is not None:
+            return [dict(message) for message in cached]
+
+        prompt = await self._get_prompt()
         format_string = input_prompt.format(**kwargs)
         content = {
             "role": "user",
@@ -70,4 +84,6 @@ class PromptTemplate:
                 "content": self.system_message
             }
             prompt.append(_system_content)
+        if cache_key is not None and len(self._messages_cache) < 256:
+            self._messages_cache[cache_key] = [dict(message) for message in prompt]
         return prompt
\ No newline at end of file
@@ -21,15 +21,14 @@ async def get_fstring_variables(s: str):
     return re.findall(r'\{(.*?)}', s)
 
 
+_PTYPE_TO_JSON_SCHEME = {
+    'int': "integer",
+    'str': "string",
+    'bool': "boolean",
+    'list': "array",
+    'dict': "object"
+}
+
+
 async def ptype_to_json_scheme(ptype: str) -> str:
-    match ptype:
-        case 'int':
-            return "integer"
-        case 'str':
-            return "string"
-        case 'bool':
-            return "boolean"
-        case 'list':
-            return "array"
-        case 'dict' | _:
-            return "object"
+    return _PTYPE_TO_JSON_SCHEME.get(ptype, "object")
@@ -31,6 +31,15 @@ class Visualize:
             output_type: str | None = None
     ):
         self.output_type = output_type or "html"
+        # Prebuilt dispatch table - a single hash lookup per render instead of
+        # a chain of case comparisons.
+        self._renderers = {
+            ChartType.LINE: self.line_chart,
+            ChartType.VBAR: self.vertical_bar,
+            ChartType.HBAR: self.horizontal_bar,
+            ChartType.PIE: self.pie_chart,
+            ChartType.TABLE: self.table_chart
+        }
 
     async def render_charts(
             self,
@@ -41,44 +50,15 @@ class Visualize:
             output_path: str | PathLike[str] | None = None,
             **kwargs
     ):
-        match chart_type.lower():
-            case ChartType.LINE:
-                await self.line_chart(
-                    data=data,
-                    output_type=output_type,
-                    output_path=output_path,
-                    **kwargs
-                )
-            case ChartType.VBAR:
-                await self.vertical_bar(
-                    data=data,
-                    output_type=output_type,
-                    output_path=output_path,
-                    **kwargs
-                )
-            case ChartType.HBAR:
-                await self.horizontal_bar(
-                    data=data,
-                    output_type=output_type,
-                    output_path=output_path,
-                    **kwargs
-                )
-            case ChartType.PIE:
-                await self.pie_chart(
-                    data=data,
-                    output_type=output_type,
-                    output_path=output_path,
-                    **kwargs
-                )
-            case ChartType.TABLE:
-                await self.table_chart(
-                    data=data,
-                    output_type=output_type,
-                    output_path=output_path,
-                    **kwargs
-                )
-            case _:
-                raise InvalidChartType(f'Invalid chart type `{chart_type}`')
+        renderer = self._renderers.get(chart_type.lower())
+        if renderer is None:
+            raise InvalidChartType(f'Invalid chart type `{chart_type}`')
+        await renderer(
+            data=data,
+            output_type=output_type,
+            output_path=output_path,
+            **kwargs
+        )
 
     async def line_chart(
             self,
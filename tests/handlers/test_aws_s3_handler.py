@@ -0,0 +1,46 @@
+import logging
+
+import pytest
+
+from superagentx.handler.aws_s3 import AWSS3Handler
+
+logger = logging.getLogger(__name__)
+
+'''
+ Run Pytest:
+
+   1.pytest --log-cli-level=INFO tests/handlers/test_aws_s3_handler.py::TestAWSS3::test_upload_file
+   2.pytest --log-cli-level=INFO tests/handlers/test_aws_s3_handler.py::TestAWSS3::test_download_file
+   3.pytest --log-cli-level=INFO tests/handlers/test_aws_s3_handler.py::TestAWSS3::test_list_buckets
+
+'''
+
+
+@pytest.fixture
+def aws_s3_handler_init() -> AWSS3Handler:
+    aws_s3_handler = AWSS3Handler(
+        bucket_name="test-superagentx"
+    )
+    return aws_s3_handler
+
+
+class TestAWSS3:
+
+    async def test_upload_file(self, aws_s3_handler_init: AWSS3Handler):
+        result = await aws_s3_handler_init.upload_file(
+            file_name="test.txt"
+        )
+        logger.info(f'Result => {result}')
+        assert result is None
+
+    async def test_download_file(self, aws_s3_handler_init: AWSS3Handler):
+        result = await aws_s3_handler_init.download_file(
+            object_name="test.txt"
+        )
+        logger.info(f'Result => {result}')
+        assert result is None
+
+    async def test_list_buckets(self, aws_s3_handler_init: AWSS3Handler):
+        result = await aws_s3_handler_init.list_buckets()
+        logger.info(f'Result => {result}')
+        assert isinstance(result, list)
@@ -0,0 +1,44 @@
+import logging
+
+import pytest
+
+from superagentx.handler.jira import JiraHandler
+
+logger = logging.getLogger(__name__)
+
+'''
+ Run Pytest:
+
+   1.pytest --log-cli-level=INFO tests/handlers/test_jira_handler.py::TestJira::test_get_list_projects
+   2.pytest --log-cli-level=INFO tests/handlers/test_jira_handler.py::TestJira::test_get_active_sprint
+   3.pytest --log-cli-level=INFO tests/handlers/test_jira_handler.py::TestJira::test_get_issue
+
+'''
+
+
+@pytest.fixture
+def jira_handler_init() -> JiraHandler:
+    jira_handler = JiraHandler()
+    return jira_handler
+
+
+class TestJira:
+
+    async def test_get_list_projects(self, jira_handler_init: JiraHandler):
+        result = await jira_handler_init.get_list_projects()
+        logger.info(f'Result => {result}')
+        assert isinstance(result, list)
+
+    async def test_get_active_sprint(self, jira_handler_init: JiraHandler):
+        result = await jira_handler_init.get_active_sprint(
+            board_id=1
+        )
+        logger.info(f'Result => {result}')
+        assert isinstance(result, object)
+
+    async def test_get_issue(self, jira_handler_init: JiraHandler):
+        result = await jira_handler_init.get_issue(
+            issue_id='PROJ-1'
+        )
+        logger.info(f'Result => {result}')
+        assert isinstance(result, dict)